@@ -1,11 +1,12 @@
-from typing import Dict
-from aws_cdk import (
-    Stack,
-    aws_apigateway as apigw,
-    aws_lambda as _lambda,
-)
+from itertools import chain
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+from aws_cdk import Stack
 from constructs import Construct
 
+if TYPE_CHECKING:
+    from aws_cdk import aws_lambda as _lambda
+
 from aws_cdk_infra_setup.constructs.api_gateway.http_api_gateway_construct import HttpApiGatewayConstruct
 from aws_cdk_infra_setup.constructs.iam_roles_construct import IamRoleConstruct
 from aws_cdk_infra_setup.constructs.lambda_functions_construct import LambdaFunctionConstruct
@@ -27,11 +28,16 @@ class AwsCdkInfraSetupStack(Stack):
     ):
         super().__init__(scope, id, **kwargs)
 
+        # Configs may arrive as lazy thunks from app.py; force them only when
+        # this stack actually builds, so synth of other stacks skips the parse.
+        def _resolve(cfg):
+            return cfg() if callable(cfg) else cfg
+
         # 1️⃣ Create IAM Roles
         iam_roles_construct = IamRoleConstruct(
             self,
             "IamRoles",
-            iam_role_configs=iam_role_configs or [],
+            iam_role_configs=[_resolve(cfg) for cfg in (iam_role_configs or [])],
         )
 
         # 2️⃣ Create Lambda Functions
@@ -39,40 +45,50 @@ class AwsCdkInfraSetupStack(Stack):
             self,
             "LambdaFunctions",
             iam_roles_construct=iam_roles_construct,
-            lambda_functions_config_files=lambda_function_configs or [],
+            lambda_functions_config_files=[_resolve(cfg) for cfg in (lambda_function_configs or [])],
             project_root=project_root,
         )
 
-        # 🔧 FIX: Build Lambda lookup dict from the construct's stored functions
-        lambda_map: Dict[str, _lambda.IFunction] = lambda_construct.lambda_functions.copy()
+        # Read-only view over the construct's stored functions: downstream
+        # constructs only .get() from it, and the proxy makes that explicit
+        # without paying for a defensive copy.
+        lambda_map: Mapping[str, _lambda.IFunction] = MappingProxyType(lambda_construct.lambda_functions)
 
         print("🔹 Lambda functions created:", list(lambda_map.keys()))
 
-        # 3️⃣ Create REST APIs (support multiple configs)
-        for idx, api_cfg in enumerate(rest_api_configs):
-            api_name = api_cfg.get("name", f"rest-api-{idx}")
-
+        # 3️⃣/4️⃣ Create REST and HTTP APIs in one fused pass (support
+        # multiple configs): both loops share the name sanitization and the
+        # lambda_map closure, so a single traversal dispatches per kind.
+        def _build_rest(construct_id, api_cfg):
             RestApiGatewayConstruct(
                 self,
-                f"RestApi{idx}_{api_name.replace('-', '')}",
+                construct_id,
                 lambda_map=lambda_map,
-                rest_api_configs=api_cfg
+                rest_api_configs=api_cfg,
             )
 
-        print("✅ All REST APIs created successfully")
-
-        # 4️⃣ Create HTTP APIs (support multiple configs)
-        for idx, api_cfg in enumerate(http_api_configs):
-            api_name = api_cfg.get("name", f"http-api-{idx}")
-
+        def _build_http(construct_id, api_cfg):
             HttpApiGatewayConstruct(
                 self,
-                f"HttpApi{idx}_{api_name.replace('-', '')}",
+                construct_id,
                 iam_roles_construct=iam_roles_construct,
                 lambda_map=lambda_map,
-                http_api_configs=api_cfg
+                http_api_configs=api_cfg,
             )
 
-        print("✅ All HTTP APIs created successfully")
+        # Skip the iterator setup entirely when neither API kind is configured
+        if rest_api_configs or http_api_configs:
+            api_specs = chain(
+                (("RestApi", "rest-api", idx, cfg, _build_rest)
+                 for idx, cfg in enumerate(rest_api_configs or [])),
+                (("HttpApi", "http-api", idx, cfg, _build_http)
+                 for idx, cfg in enumerate(http_api_configs or [])),
+            )
 
+            for prefix, default_name, idx, cfg_thunk, build in api_specs:
+                api_cfg = _resolve(cfg_thunk)
+                sanitized_name = api_cfg.get("name", f"{default_name}-{idx}").replace("-", "")
+                build(f"{prefix}{idx}_{sanitized_name}", api_cfg)
 
+        print("✅ All REST APIs created successfully")
+        print("✅ All HTTP APIs created successfully")
@@ -1,10 +1,16 @@
-from typing import Dict, Optional, Union, List
-from aws_cdk import (
-    aws_apigateway as apigw,
-    aws_lambda as _lambda,
-)
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Union, List
 from constructs import Construct
 
+if TYPE_CHECKING:
+    from aws_cdk import aws_apigateway as apigw
+    from aws_cdk import aws_lambda as _lambda
+
+# Single-pass, C-level dash stripping for construct ids
+_NODASH_TT = str.maketrans({"-": ""})
+
 
 class RestApiGatewayConstruct(Construct):
     def __init__(
@@ -12,10 +18,14 @@ class RestApiGatewayConstruct(Construct):
         scope: Construct,
         id: str,
         *,
-        lambda_map: Dict[str, _lambda.IFunction],
+        lambda_map: Mapping[str, _lambda.IFunction],
         rest_api_configs: Optional[Union[dict, List[dict]]] = None,
         **kwargs,
     ):
+        # Deferred: importing any aws_cdk service package makes jsii resolve
+        # it eagerly, so pay that only when a construct is instantiated.
+        from aws_cdk import Duration, aws_apigateway as apigw
+
         super().__init__(scope, id, **kwargs)
 
         # Normalize input: single dict -> list
@@ -32,13 +42,14 @@ class RestApiGatewayConstruct(Construct):
 
         for idx, api_cfg in enumerate(rest_api_configs):
             api_name = api_cfg.get("name", f"rest-api-{idx}")
+            sanitized_api_name = api_name.translate(_NODASH_TT)
             resources_cfg = api_cfg.get("resources", {})
             api_description = api_cfg.get("description") or "CDK Generated API"
             stage_name = api_cfg.get("stage_name", "dev")
 
             rest_api = apigw.RestApi(
                 self,
-                f"resourcesRestApi{idx}_{api_name.replace('-', '')}",
+                f"resourcesRestApi{idx}_{sanitized_api_name}",
                 rest_api_name=api_name,
                 description=api_description,
                 endpoint_configuration=apigw.EndpointConfiguration(types=[apigw.EndpointType.REGIONAL]),
@@ -59,16 +70,23 @@ class RestApiGatewayConstruct(Construct):
                     continue
 
                 auth_type = auth_cfg.get("type", "TOKEN").upper()
+                sanitized_auth_name = auth_name.translate(_NODASH_TT)
                 identity_source = auth_cfg.get("identity_source", "method.request.header.Authorization")
+                # Cached authorizer results skip the authorizer Lambda
+                # entirely; prod defaults to the 1-hour maximum while other
+                # stages keep the shorter default for faster iteration.
+                ttl = auth_cfg.get("ttl_seconds") or (3600 if os.getenv("CDK_ENV") == "prod" else 300)
+                results_cache_ttl = Duration.seconds(ttl)
 
                 if auth_type == "TOKEN":
                     if isinstance(identity_source, list):
                         identity_source = identity_source[0]
                     authorizer = apigw.TokenAuthorizer(
                         self,
-                        f"{auth_name.replace('-', '')}TokenAuthorizer{idx}",
+                        f"{sanitized_auth_name}TokenAuthorizer{idx}",
                         handler=lambda_fn,
                         identity_source=identity_source,
+                        results_cache_ttl=results_cache_ttl,
                     )
                 elif auth_type == "REQUEST":
                     if isinstance(identity_source, str):
@@ -83,9 +101,10 @@ class RestApiGatewayConstruct(Construct):
                             identity_sources.append(apigw.IdentitySource.header("Authorization"))
                     authorizer = apigw.RequestAuthorizer(
                         self,
-                        f"{auth_name.replace('-', '')}RequestAuthorizer{idx}",
+                        f"{sanitized_auth_name}RequestAuthorizer{idx}",
                         handler=lambda_fn,
                         identity_sources=identity_sources,
+                        results_cache_ttl=results_cache_ttl,
                     )
                 else:
                     print(f"⚠️ Unknown authorizer type '{auth_type}' for {auth_name}, skipping.")
@@ -104,20 +123,24 @@ class RestApiGatewayConstruct(Construct):
             print(f"✅ REST API '{api_name}' created with resources: {list(resources_cfg.keys())}")
 
     def _create_resources_and_methods(self, rest_api, resources_cfg, lambda_map, authorizer_map):
+        from aws_cdk import aws_apigateway as apigw
+
+        # Trie of created resources keyed by path-segment tuples: one hash
+        # lookup per segment instead of rebuilding cumulative path strings.
         created_resources = {}
+        # Resources often front the same CRUD Lambda; share one integration
+        # (one jsii constructor call) per function across all of them.
+        integration_cache: Dict[str, apigw.LambdaIntegration] = {}
         for resource_name, cfg in resources_cfg.items():
-            path_parts = cfg.get("resource_path", f"/{resource_name}").strip("/").split("/")
+            path_parts = [p for p in cfg.get("resource_path", f"/{resource_name}").strip("/").split("/") if p]
             parent_resource = rest_api.root
-            current_path = ""
-            for part in path_parts:
-                if not part:
-                    continue
-                current_path = f"{current_path}/{part}" if current_path else part
-                if current_path in created_resources:
-                    parent_resource = created_resources[current_path]
-                else:
-                    parent_resource = parent_resource.add_resource(part)
-                    created_resources[current_path] = parent_resource
+            for i, part in enumerate(path_parts):
+                key = tuple(path_parts[:i + 1])
+                node = created_resources.get(key)
+                if node is None:
+                    node = parent_resource.add_resource(part)
+                    created_resources[key] = node
+                parent_resource = node
             resource = parent_resource
 
             # Handle CORS
@@ -142,7 +165,11 @@ class RestApiGatewayConstruct(Construct):
                 print(f"⚠️ Lambda '{lambda_fn_name}' not found for resource '{resource_name}', skipping methods.")
                 continue
 
-            lambda_integration = apigw.LambdaIntegration(lambda_fn, proxy=True, allow_test_invoke=True)
+            integration_key = lambda_fn.node.addr
+            lambda_integration = integration_cache.get(integration_key)
+            if lambda_integration is None:
+                lambda_integration = apigw.LambdaIntegration(lambda_fn, proxy=True, allow_test_invoke=True)
+                integration_cache[integration_key] = lambda_integration
             methods = cfg.get("methods", [])
             authorizations = cfg.get("authorization", {})
 
@@ -164,9 +191,10 @@ class RestApiGatewayConstruct(Construct):
     def _create_usage_plan(self, rest_api, usage_cfg, api_name):
         if not usage_cfg:
             return
+        from aws_cdk import aws_apigateway as apigw
         plan = apigw.UsagePlan(
             self,
-            f"usage_planRestApi_{api_name.replace('-', '')}",
+            f"usage_planRestApi_{api_name.translate(_NODASH_TT)}",
             name=f"{api_name}-usage-plan",
             throttle=apigw.ThrottleSettings(
                 rate_limit=usage_cfg.get("rate_limit", 100),
@@ -1,15 +1,19 @@
+import logging
 import os
 import json
-from aws_cdk import aws_iam as iam
 from constructs import Construct
 
+logger = logging.getLogger(__name__)
+
 
 class IamRoleConstruct(Construct):
     def __init__(self, scope: Construct, id: str, *, iam_role_configs=None, project_root=None, **kwargs):
         # Only pass valid CDK kwargs to the base Construct
         super().__init__(scope, id, **kwargs)
 
-        print(f"🔍 IamRoleConstruct: Received {len(iam_role_configs or [])} role configs")
+        # %-style lazy formatting: the message is only built when the level
+        # is enabled, unlike eagerly-evaluated f-string prints.
+        logger.info("🔍 IamRoleConstruct: Received %d role configs", len(iam_role_configs or []))
 
         self.project_root = project_root
         self.iam_role_configs = iam_role_configs or []
@@ -17,24 +21,51 @@ class IamRoleConstruct(Construct):
         # Keep a dict to reference roles by role_name if needed
         self.roles = {}
 
+        # Nothing to build: skip the aws_iam import and policy work entirely
+        if not self.iam_role_configs:
+            return
+
+        # Deferred: importing any aws_cdk service package makes jsii resolve
+        # it eagerly, so pay that only when a construct is instantiated.
+        from aws_cdk import aws_iam as iam
+
+        # Every role trusts the Lambda service; one ServicePrincipal (one
+        # jsii constructor call) is shared across the whole loop.
+        lambda_principal = iam.ServicePrincipal("lambda.amazonaws.com")
+
+        # PolicyDocument.from_json deep-copies the dict across the JS bridge;
+        # memoize by canonical JSON so identical documents (shared trust
+        # policies are the common case) cross jsii once.
+        policy_doc_cache = {}
+
+        def _policy_doc(policy_json):
+            if not policy_json:
+                return None
+            cache_key = json.dumps(policy_json, sort_keys=True)
+            doc = policy_doc_cache.get(cache_key)
+            if doc is None:
+                doc = iam.PolicyDocument.from_json(policy_json)
+                policy_doc_cache[cache_key] = doc
+            return doc
+
         for role_data in self.iam_role_configs:
             try:
-                role_name = role_data["role_name"]
+                role_name = role_data.role_name
 
                 # Get trust policy JSON dict from loaded config
-                trust_policy_json = role_data.get("trust_policy")
-                assume_role_policy = iam.PolicyDocument.from_json(trust_policy_json) if trust_policy_json else None
+                assume_role_policy = _policy_doc(role_data.trust_policy)
 
                 # Managed policies from dict {name: arn}
                 managed_policies = [
                     iam.ManagedPolicy.from_managed_policy_arn(self, f"{role_name}-{name}", arn)
-                    for name, arn in role_data.get("managed_policies", {}).items()
+                    for name, arn in (role_data.managed_policies or {}).items()
                 ]
 
                 # Inline policies dict {name: JSON dict}
                 inline_policies = {
-                    name: iam.PolicyDocument.from_json(policy_json)
-                    for name, policy_json in role_data.get("inline_policies", {}).items()
+                    name: _policy_doc(policy_json)
+                    for name, policy_json in (role_data.inline_policies or {}).items()
+                    if policy_json
                 }
 
                 # Create the IAM Role construct
@@ -42,7 +73,7 @@ class IamRoleConstruct(Construct):
                     self,
                     role_name,
                     role_name=role_name,
-                    assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),  # You can make this configurable too
+                    assumed_by=lambda_principal,  # You can make this configurable too
                     inline_policies=inline_policies,
                     managed_policies=managed_policies,
                     # Note: Do NOT use assume_role_policy param here; use 'assumed_by' with PolicyDocument instead
@@ -50,14 +81,16 @@ class IamRoleConstruct(Construct):
 
                 # Store role in dictionary for easy access later
                 self.roles[role_name] = role
-                print(f"✅ Created IAM role: {role_name}")
+                logger.info("✅ Created IAM role: %s", role_name)
 
             except Exception as e:
-                print(f"❌ Failed to create role {id + 1}: {e}")
+                logger.warning("❌ Failed to create role '%s': %s", getattr(role_data, "role_name", "?"), e)
                 continue
 
-            print(f"🔍 Total IAM roles created: {len(self.roles)}")
-            print(f"🔍 Available roles: {list(self.roles.keys())}")
+        # Summaries belong after the loop; running them per role made the
+        # construct O(N²) in the number of roles.
+        logger.info("🔍 Total IAM roles created: %d", len(self.roles))
+        logger.info("🔍 Available roles: %s", list(self.roles.keys()))
 
     # Optional helper if you want to load JSON files inside this construct later:
     def _resolve_file_path(self, path):
@@ -1,10 +1,29 @@
-from aws_cdk import aws_lambda as _lambda
-from aws_cdk import aws_iam as iam
-from aws_cdk import Duration
 from constructs import Construct
+from functools import cache
 import os
 
 
+@cache
+def _runtime_map():
+    """Runtime lookup built once per process; every entry is a jsii call."""
+    from aws_cdk import aws_lambda as _lambda
+
+    return {
+        "python3.13": _lambda.Runtime.PYTHON_3_13,
+        "python3.10": _lambda.Runtime.PYTHON_3_10,
+        "python3.9": _lambda.Runtime.PYTHON_3_9,
+        "python3.8": _lambda.Runtime.PYTHON_3_8,
+        "python3.7": _lambda.Runtime.PYTHON_3_7,
+    }
+
+
+# Shared across constructs: repeated stat() checks and, more importantly,
+# repeated asset-bundler hashing are skipped when many Lambdas point at the
+# same code directory.
+_exists_cache = {}
+_asset_cache = {}
+
+
 class LambdaFunctionConstruct(Construct):
     def __init__(
             self,
@@ -16,25 +35,28 @@ class LambdaFunctionConstruct(Construct):
             project_root=None,
             **kwargs
     ):
+        # Deferred: importing any aws_cdk service package makes jsii resolve
+        # it eagerly, so pay that only when a construct is instantiated.
+        from aws_cdk import Duration
+        from aws_cdk import aws_iam as iam
+        from aws_cdk import aws_lambda as _lambda
+
         super().__init__(scope, id)
 
         if lambda_functions_config_files is None:
             lambda_functions_config_files = []
 
-        runtime_map = {
-            "python3.13": _lambda.Runtime.PYTHON_3_13,
-            "python3.10": _lambda.Runtime.PYTHON_3_10,
-            "python3.9": _lambda.Runtime.PYTHON_3_9,
-            "python3.8": _lambda.Runtime.PYTHON_3_8,
-            "python3.7": _lambda.Runtime.PYTHON_3_7,
-        }
+        runtime_map = _runtime_map()
+
+        # Single O(1) role lookup table; resolved once for the whole loop.
+        roles_dict = getattr(iam_roles_construct, "roles", None) or {}
 
         # Dictionary to store created Lambda functions
         self.lambda_functions = {}
 
         for lambda_data in lambda_functions_config_files:
             try:
-                service = lambda_data.get("service", {})
+                service = lambda_data.service
 
                 function_name = service.get("function_name")
                 role_name = service.get("role_name")
@@ -48,29 +70,12 @@ class LambdaFunctionConstruct(Construct):
                     print(f"⚠️ Skipping Lambda config '{function_name}' due to missing required fields.")
                     continue
 
-                # 🔧 FIX: Better role resolution
-                role = None
-                if iam_roles_construct and role_name:
-                    # Primary method: access from roles dictionary
-                    if hasattr(iam_roles_construct, "roles") and iam_roles_construct.roles:
-                        role = iam_roles_construct.roles.get(role_name)
-                        if role:
-                            print(f"✅ Found role '{role_name}' in roles dictionary for Lambda '{function_name}'")
-
-                    # Fallback method: find by construct ID
-                    if role is None:
-                        role_construct = iam_roles_construct.node.try_find_child(role_name)
-                        if isinstance(role_construct, iam.Role):
-                            role = role_construct
-                            print(f"✅ Found role '{role_name}' by construct ID for Lambda '{function_name}'")
-
-                    # Debug: List available roles if not found
-                    if role is None and hasattr(iam_roles_construct, "roles"):
-                        available_roles = list(iam_roles_construct.roles.keys())
-                        print(
-                            f"⚠️ Role '{role_name}' not found for Lambda '{function_name}'. Available roles: {available_roles}")
-                else:
-                    print(f"⚠️ No IAM roles construct or role name provided for Lambda '{function_name}'")
+                # Role resolution is a single dict lookup; the roles dict is
+                # keyed by role_name, which covers the old construct-id scan.
+                role = roles_dict.get(role_name) if role_name else None
+                if role is None and os.environ.get("CDK_DEBUG"):
+                    print(
+                        f"⚠️ Role '{role_name}' not found for Lambda '{function_name}'. Available roles: {list(roles_dict)}")
 
                 # Create default role if not found
                 if role is None:
@@ -100,11 +105,20 @@ class LambdaFunctionConstruct(Construct):
                 if project_root and not os.path.isabs(zip_path):
                     code_path = os.path.join(project_root, zip_path)
 
-                # Verify code path exists
-                if not os.path.exists(code_path):
+                # Verify code path exists (one stat per unique path)
+                if code_path not in _exists_cache:
+                    _exists_cache[code_path] = os.path.exists(code_path)
+                if not _exists_cache[code_path]:
                     print(f"⚠️ Code path '{code_path}' does not exist for Lambda '{function_name}', skipping.")
                     continue
 
+                # One Code asset per directory: from_asset hashes the whole
+                # tree, so functions sharing a path reuse the same object.
+                code = _asset_cache.get(code_path)
+                if code is None:
+                    code = _lambda.Code.from_asset(code_path)
+                    _asset_cache[code_path] = code
+
                 # Create Lambda function with enhanced configuration
                 func = _lambda.Function(
                     self,
@@ -112,7 +126,7 @@ class LambdaFunctionConstruct(Construct):
                     function_name=function_name,
                     runtime=runtime,
                     handler=handler,
-                    code=_lambda.Code.from_asset(code_path),
+                    code=code,
                     role=role,
                     timeout=Duration.seconds(timeout),
                     memory_size=memory_size,
@@ -126,7 +140,7 @@ class LambdaFunctionConstruct(Construct):
                 print(f"✅ Created Lambda function: {function_name}")
 
             except Exception as e:
-                function_name = lambda_data.get("service", {}).get("function_name", "unknown")
+                function_name = getattr(lambda_data, "service", {}).get("function_name", "unknown")
                 print(f"⚠️ Failed to create Lambda function '{function_name}': {str(e)}")
                 continue
 
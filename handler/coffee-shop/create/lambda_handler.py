@@ -1,49 +1,81 @@
 import json
+import logging
 import os
+from base64 import b64decode
+
 import boto3
 
 from botocore.exceptions import ClientError
+from functools import lru_cache
 from utils.dynamodb_utils import create_response
 
-# Initialize DynamoDB resource
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "WARNING"))
+
+try:
+    from orjson import JSONDecodeError, loads
+except ImportError:
+    from json import JSONDecodeError, loads
+
+# Attributes every coffee item must carry
+_REQUIRED = ("coffeeId", "name", "price", "available")
+
+# Initialize DynamoDB resource and table handle once per container;
+# warm invocations reuse them instead of rebuilding the service model.
 dynamodb = boto3.resource("dynamodb")
 
 
+@lru_cache(maxsize=4)
+def _get_table(table_name):
+    return dynamodb.Table(table_name)
+
+
+_TABLE = _get_table(os.environ.get("tableName", "CoffeeShop"))
+
+
 def create_coffee(event, context):
     """
     Lambda function to create a new coffee item in DynamoDB.
     - Requires coffeeId, name, price, and available.
     - Uses a condition to prevent overwriting existing items.
     """
-    table_name = os.getenv("tableName", "CoffeeShop")
-    table = dynamodb.Table(table_name)
+    table = _TABLE
 
-    # Parse request body
+    # Parse request body. Direct invocations and test events often pass an
+    # already-decoded dict; skip the serialize/deserialize roundtrip for them.
     body = event.get("body")
-    try:
-        body_data = json.loads(body or "{}")
-    except json.JSONDecodeError:
-        return create_response(400, {"error": "Invalid JSON in request body"})
+    if isinstance(body, dict):
+        body_data = body
+    else:
+        if body and event.get("isBase64Encoded"):
+            body = b64decode(body)
+        try:
+            body_data = loads(body or "{}")
+        except JSONDecodeError:
+            return create_response(400, {"error": "Invalid JSON in request body"})
+
+    # Validate required fields in one scan; an explicit None check keeps
+    # legitimate falsy values like price == 0 or available == False valid.
+    missing = [k for k in _REQUIRED if body_data.get(k) is None]
+    if missing:
+        return create_response(
+            400,
+            {"error": f"Missing required attributes: {', '.join(missing)}."},
+        )
 
     coffee_id = body_data.get("coffeeId")
     name = body_data.get("name")
     price = body_data.get("price")
     available = body_data.get("available")
 
-    print("values:", coffee_id, name, price, available)
-
-    # Validate required fields
-    if not coffee_id or not name or not price or available is None:
-        return create_response(
-            409,
-            {
-                "error": "Missing required attributes: coffeeId, name, price, or available."
-            },
-        )
+    # Deferred %s formatting: never rendered unless DEBUG is enabled
+    logger.debug("values: %s %s %s %s", coffee_id, name, price, available)
 
     try:
-        # Equivalent of PutCommand with ConditionExpression
-        response = table.put_item(
+        # Equivalent of PutCommand with ConditionExpression. Explicit NONE
+        # return values keep the response minimal; the client gets a small
+        # ack instead of the raw DynamoDB result with its ResponseMetadata.
+        table.put_item(
             Item={
                 "coffeeId": coffee_id,
                 "name": name,
@@ -51,15 +83,17 @@ def create_coffee(event, context):
                 "available": available,
             },
             ConditionExpression="attribute_not_exists(coffeeId)",
+            ReturnValues="NONE",
+            ReturnConsumedCapacity="NONE",
         )
 
-        return create_response(201, {"message": "Item Created Successfully!", "response": response})
+        return create_response(201, {"message": "Item Created Successfully!", "coffeeId": coffee_id})
 
     except ClientError as err:
         if err.response["Error"]["Code"] == "ConditionalCheckFailedException":
             return create_response(409, {"error": "Item already exists!"})
         else:
-            print("Error inserting data into DynamoDB:", err)
+            logger.error("Error inserting data into DynamoDB: %s", err)
             return create_response(
                 500,
                 {
@@ -1,22 +1,40 @@
+import logging
 import os
 import boto3
 
 from botocore.exceptions import ClientError
+from functools import lru_cache
 from utils.dynamodb_utils import create_response
 
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "WARNING"))
 
-# Initialize DynamoDB resource
+
+# Initialize DynamoDB resource and table handle once per container;
+# warm invocations reuse them instead of rebuilding the service model.
 dynamodb = boto3.resource("dynamodb")
 
 
+@lru_cache(maxsize=4)
+def _get_table(table_name):
+    return dynamodb.Table(table_name)
+
+
+_TABLE = _get_table(os.environ.get("tableName", "CoffeeShop"))
+
+# Low-level paginator for full-table reads; the resource-level scan returns
+# at most 1 MB in a single shot and silently truncates beyond that.
+_client = boto3.client("dynamodb")
+_paginator = _client.get_paginator("scan")
+
+
 def get_coffee(event, context):
     """
     Lambda function to get coffee item(s) from DynamoDB.
     - If an id is provided in pathParameters, fetch single item (GetItem).
     - Otherwise, scan the whole table.
     """
-    table_name = os.getenv("tableName", "CoffeeShop")
-    table = dynamodb.Table(table_name)
+    table = _TABLE
 
     path_params = event.get("pathParameters") or {}
     coffee_id = path_params.get("id")
@@ -27,12 +45,20 @@ def get_coffee(event, context):
             response = table.get_item(
                 Key={"coffeeId": coffee_id}
             )
-        else:
-            # Equivalent of ScanCommand
-            response = table.scan()
+            return create_response(200, response)
 
-        return create_response(200, response)
+        # Paginated scan projecting only the attributes clients consume;
+        # streams every page instead of truncating at 1 MB and never ships
+        # ResponseMetadata back through API Gateway.
+        pages = _paginator.paginate(
+            TableName=table.name,
+            ProjectionExpression="coffeeId,#n,price,available",
+            ExpressionAttributeNames={"#n": "name"},
+            PaginationConfig={"PageSize": 100},
+        )
+        items = [item for page in pages for item in page.get("Items", [])]
+        return create_response(200, {"items": items})
 
     except ClientError as err:
-        print("Error fetching data from DynamoDB:", err)
+        logger.error("Error fetching data from DynamoDB: %s", err)
         return create_response(500, {"error": str(err)})
@@ -1,24 +1,146 @@
 # aws_cdk_infra_setup/config_loader.py
 import os
+import threading
+import weakref
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
 from aws_cdk import App
 
 
+@dataclass(frozen=True, slots=True)
+class StageContext:
+    """Resolved stage configuration with C-level slot access per field."""
+
+    stage_name: str
+    region: str = None
+    account_id: str = None
+    secrets_file: str = None
+    variables: Mapping = field(default_factory=dict)
+
+# Environment variables are fixed after process init (Lambda never changes
+# them post-container-start), so resolve the stage override once.
+_ENV_STAGE = os.getenv("STAGE")
+
+# Flat {(stage, key): value} pivot per App: hot variable reads resolve in
+# one dict probe from here instead of walking stage -> variables -> key.
+_hot_vars = weakref.WeakKeyDictionary()
+
+# Merged config per App, prebuilt for every stage declared in context.
+# Keyed weakly on the App so entries die with it; every stack in the same
+# app then shares one context walk and one merge pass instead of
+# repeating them during synth.
+_stage_config_cache = weakref.WeakKeyDictionary()
+
+# Guards the one-shot table build; config loads elsewhere already fan out
+# over thread pools, so first calls may race.
+_stage_config_lock = threading.Lock()
+
+# StageContext instances per App, built on demand from the dict form above.
+_stage_context_cache = weakref.WeakKeyDictionary()
+
+
+def _build_stage_table(app: App):
+    """Merge stage and variable context for all declared stages in one pass."""
+    get = app.node.try_get_context
+    stages_ctx = get("stages")
+    variables_ctx = get("variables")
+
+    # Validate the context shape once here rather than papering over bad
+    # config with per-call fallbacks; a malformed cdk.json should fail the
+    # synth immediately instead of producing empty stacks.
+    if stages_ctx is None:
+        stages_ctx = {}
+    elif not isinstance(stages_ctx, dict):
+        raise TypeError(f"'stages' context must be a mapping, got {type(stages_ctx).__name__}")
+    if variables_ctx is None:
+        variables_ctx = {}
+    elif not isinstance(variables_ctx, dict):
+        raise TypeError(f"'variables' context must be a mapping, got {type(variables_ctx).__name__}")
+
+    # Read-only views let every caller share the single cached instance;
+    # without them one stack mutating its config would leak into the rest.
+    return {
+        stage: MappingProxyType({
+            **stage_config,
+            "variables": MappingProxyType(variables_ctx.get(stage, {})),
+            "stage_name": stage,
+        })
+        for stage, stage_config in stages_ctx.items()
+    }
+
+
 def load_stage_config(app: App, stage_name: str = None):
     """
     Load stage-specific and variable config from cdk.json.
     Returns a merged dict containing region, account_id, secrets_file, and variables.
     """
     # Determine stage from argument, env, or default to "dev"
-    stage = stage_name or app.node.try_get_context("stage") or os.getenv("STAGE") or "dev"
+    stage = stage_name or app.node.try_get_context("stage") or _ENV_STAGE or "dev"
 
-    stages_ctx = app.node.try_get_context("stages") or {}
-    variables_ctx = app.node.try_get_context("variables") or {}
+    per_app = _stage_config_cache.get(app)
+    if per_app is None:
+        # Double-checked under the lock so concurrent first calls build
+        # the table exactly once per app.
+        with _stage_config_lock:
+            per_app = _stage_config_cache.get(app)
+            if per_app is None:
+                per_app = _stage_config_cache[app] = _build_stage_table(app)
+    cached = per_app.get(stage)
+    if cached is not None:
+        return cached
 
-    stage_config = stages_ctx.get(stage, {})
-    stage_variables = variables_ctx.get(stage, {})
+    # Stage not declared under "stages": build (and cache) the same shape
+    # the merge above would produce, with empty stage config.
+    merged = MappingProxyType({
+        "variables": MappingProxyType(
+            (app.node.try_get_context("variables") or {}).get(stage, {})
+        ),
+        "stage_name": stage,
+    })
+    per_app[stage] = merged
+    return merged
 
-    # Merge variables into stage config
-    merged = {**stage_config, "variables": stage_variables}
-    merged["stage_name"] = stage
 
-    return merged
+def load_stage_context(app: App, stage_name: str = None) -> StageContext:
+    """
+    Like load_stage_config, but returns a frozen StageContext so call sites
+    read cfg.region instead of paying a string-keyed dict lookup per field.
+    Cached per (app, stage) alongside the dict form.
+    """
+    config = load_stage_config(app, stage_name)
+    stage = config["stage_name"]
+
+    contexts = _stage_context_cache.get(app)
+    if contexts is None:
+        contexts = _stage_context_cache[app] = {}
+    context = contexts.get(stage)
+    if context is None:
+        context = contexts[stage] = StageContext(
+            stage_name=stage,
+            region=config.get("region"),
+            account_id=config.get("account_id"),
+            secrets_file=config.get("secrets_file"),
+            variables=config["variables"],
+        )
+    return context
+
+
+def get_stage_variable(app: App, key: str, stage_name: str = None, default=None):
+    """
+    Look up a single stage variable, pinned in a flat per-app pivot cache.
+    Repeat reads of the same (stage, key) pair cost one dict probe.
+    """
+    pivot = _hot_vars.get(app)
+    if pivot is None:
+        pivot = _hot_vars[app] = {}
+
+    config = load_stage_config(app, stage_name)
+    flat_key = (config["stage_name"], key)
+    if flat_key in pivot:
+        return pivot[flat_key]
+
+    value = config["variables"].get(key, default)
+    pivot[flat_key] = value
+    return value
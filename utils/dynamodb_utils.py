@@ -1,28 +1,87 @@
 import os
 import json
+import functools
+
 import boto3
 
+# Fastest available encoder wins: msgspec's Encoder keeps stable
+# per-type caches across calls, orjson is the next best, stdlib json is
+# the always-there fallback.
+try:
+    import msgspec
+
+    _encode = msgspec.json.Encoder().encode
+
+    def _dumps(body):
+        return _encode(body).decode("utf-8")
+except ImportError:
+    try:
+        import orjson
+
+        def _dumps(body):
+            return orjson.dumps(body).decode("utf-8")
+    except ImportError:
+        _dumps = json.dumps
+
+
+# DynamoDB handles are built lazily: handlers that only import this module
+# for create_response would otherwise pay the service-model parse (hundreds
+# of ms of cold start) for clients they never touch. The resource and
+# client share one Session so the service JSON model is parsed once even
+# when both end up used.
+
+@functools.cache
+def _session():
+    return boto3.session.Session()
+
+
+@functools.cache
+def _resource():
+    return _session().resource('dynamodb')
+
+
+@functools.cache
+def _client():
+    return _session().client('dynamodb')
+
+
+# Shared across every response; callers must treat it as read-only.
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
-# Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb')
-dynamodb_client = boto3.client('dynamodb')
+# Fixed 3-key envelope: copying a prebuilt dict is a single C-level
+# memcpy, cheaper than re-inserting the keys from a literal per response.
+_RESP_TEMPLATE = {"statusCode": 0, "headers": _JSON_HEADERS, "body": ""}
 
 
 # ---------- Utility Functions ----------
 
+@functools.lru_cache(maxsize=32)
 def get_dynamodb_table(table_name):
-    """Get DynamoDB table resource"""
-    return dynamodb.Table(table_name)
+    """Get DynamoDB table resource (one Table proxy per name per container)"""
+    return _resource().Table(table_name)
 
 
 def create_response(status_code, body):
     """
     Create a standard Lambda HTTP response.
     """
-    return {
-        "statusCode": status_code,
-        "headers": {"Content-Type": "application/json"},
-        "body": json.dumps(body),
-    }
+    # Fast path for the hottest response shape: a bare {"message": str}
+    # with nothing to escape is templated directly, skipping the JSON
+    # encoder entirely. Anything else takes the full serializer.
+    if (
+        isinstance(body, dict)
+        and len(body) == 1
+        and isinstance((message := body.get("message")), str)
+        and '"' not in message
+        and "\\" not in message
+        and message.isprintable()
+    ):
+        body_str = '{"message": "' + message + '"}'
+    else:
+        body_str = _dumps(body)
+    response = _RESP_TEMPLATE.copy()
+    response["statusCode"] = status_code
+    response["body"] = body_str
+    return response
 
 
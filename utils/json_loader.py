@@ -1,11 +1,126 @@
+import atexit
+import copy
 import json
+import mmap
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Below this size the mmap setup overhead outweighs the zero-copy win,
+# so small files take the plain read path.
+_MMAP_THRESHOLD = 64 * 1024
+
+# Parsed configs persist across cdk synth runs; entries are validated
+# against mtime + size so edited files are reparsed.
+_CACHE_PATH = os.path.join("cdk.out", ".config-cache.pkl")
 
 
 class JsonLoader:
+    _cache = None
+    _cache_dirty = False
+
+    @classmethod
+    def _get_cache(cls) -> dict:
+        if cls._cache is None:
+            try:
+                with open(_CACHE_PATH, "rb") as f:
+                    cls._cache = pickle.load(f)
+            except (OSError, pickle.PickleError, EOFError):
+                cls._cache = {}
+            atexit.register(cls._save_cache)
+        return cls._cache
+
+    @classmethod
+    def _save_cache(cls):
+        if not cls._cache_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+            with open(_CACHE_PATH, "wb") as f:
+                pickle.dump(cls._cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            # The cache is best-effort; synth output must not depend on it.
+            pass
+
     @staticmethod
     def load_json(file_path: str) -> dict:
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"JSON file not found: {file_path}")
-        with open(file_path, "r") as f:
-            return json.load(f)
+        # EAFP: the stat below already tells us whether the file exists, so
+        # a separate exists() probe would just double the syscalls and open
+        # a check-then-use race.
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"JSON file not found: {file_path}") from e
+        abs_path = os.path.abspath(file_path)
+        cache = JsonLoader._get_cache()
+        entry = cache.get(abs_path)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            # Hand out a copy: the cached value is also what gets pickled
+            # to disk, so a caller mutating its config must not poison
+            # later loads or the next synth run.
+            return copy.deepcopy(entry[2])
+
+        data = JsonLoader._parse_file(file_path, st.st_size)
+        cache[abs_path] = (st.st_mtime_ns, st.st_size, data)
+        JsonLoader._cache_dirty = True
+        return copy.deepcopy(data)
+
+    @staticmethod
+    def load_many(paths) -> dict:
+        """Load a batch of JSON files in one pass, returning {path: parsed}.
+
+        Amortizes the cache lookup machinery over the whole batch; each
+        file still goes through load_json, so mtime validation and the
+        cross-run cache apply as usual.
+        """
+        # Force the cache (and its atexit hook) once up front rather than
+        # per file inside the loop.
+        JsonLoader._get_cache()
+        return {path: JsonLoader.load_json(path) for path in paths}
+
+    @staticmethod
+    def load_parallel(paths) -> dict:
+        """Load independent JSON files concurrently, returning {path: parsed}.
+
+        File reads release the GIL (and orjson parses in C), so a small
+        thread pool overlaps the I/O instead of paying it serially.
+        executor.map preserves input order for the zip below.
+        """
+        paths = list(paths)
+        if len(paths) < 2:
+            return {path: JsonLoader.load_json(path) for path in paths}
+        JsonLoader._get_cache()
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return dict(zip(paths, executor.map(JsonLoader.load_json, paths)))
+
+    @staticmethod
+    def _parse_file(file_path: str, size: int) -> dict:
+        # Read as bytes and parse in one _loads call: orjson consumes bytes
+        # natively and json.loads accepts bytes too, so this skips both the
+        # text-mode UTF-8 decode pass and json.load's incremental
+        # stream-wrapper tokenizer. Large files take the mmap branch below
+        # to avoid one big transient buffer allocation; the caller already
+        # stat'ed the file, so reuse its size instead of an fstat here.
+        # buffering=0 skips the BufferedReader layer: both branches consume
+        # the file in one shot, so its chunking only adds an extra copy.
+        with open(file_path, "rb", buffering=0) as f:
+            if size >= _MMAP_THRESHOLD:
+                # Large files are mapped instead of copied into a user-space
+                # buffer; the page cache then serves repeat synth runs.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        try:
+                            return _loads(view)
+                        except TypeError:
+                            # stdlib json does not take memoryviews
+                            return _loads(view.tobytes())
+                    finally:
+                        view.release()
+            return _loads(f.read())